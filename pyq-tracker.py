@@ -1,6 +1,10 @@
 import os
 import json
-from flask import Flask, render_template_string, request, jsonify
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from flask import Flask, render_template_string, request, jsonify, Response, stream_with_context
 
 # ====================================================================================
 # 1. FLASK BACKEND SETUP (No Changes to Logic)
@@ -12,12 +16,15 @@ app = Flask(__name__)
 storage_dir = '/storage/emulated/0/progress'
 FILE_PATH = os.path.join(storage_dir, 'pyq_topics.txt')
 
+# Held around every read-modify-write of the data file; the dev server handles requests on threads
+file_lock = threading.Lock()
+
 # --- Helper Functions for File Operations ---
-def read_papers_from_file():
+def iter_papers_from_file():
+    # Yields one paper at a time so callers can stream without holding the whole file in memory
     if not os.path.exists(FILE_PATH): 
-        return []
+        return
     
-    papers = []
     try:
         with open(FILE_PATH, 'r', encoding='utf-8') as f:
             current_paper_code = None
@@ -29,7 +36,7 @@ def read_papers_from_file():
 
                 if line.startswith("[PAPER:"):
                     if current_paper_code is not None:
-                        papers.append({'code': current_paper_code, 'topics': current_topics})
+                        yield {'code': current_paper_code, 'topics': current_topics}
                     
                     current_paper_code = line.split(":", 1)[1].replace("]", "").strip()
                     current_topics = []
@@ -51,17 +58,19 @@ def read_papers_from_file():
                     })
             
             if current_paper_code is not None:
-                papers.append({'code': current_paper_code, 'topics': current_topics})
+                yield {'code': current_paper_code, 'topics': current_topics}
                 
     except Exception as e:
         print(f"Error reading file: {e}")
-        return []
-        
-    return papers
+
+def read_papers_from_file():
+    return list(iter_papers_from_file())
 
 def write_papers_to_file(papers):
     os.makedirs(storage_dir, exist_ok=True)
-    with open(FILE_PATH, 'w', encoding='utf-8') as f:
+    # Write a unique temp file and swap it in, so a reader still streaming the old file keeps a consistent snapshot
+    fd, tmp_path = tempfile.mkstemp(dir=storage_dir, suffix='.tmp')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
         for paper in papers:
             f.write(f"[PAPER: {paper['code']}]\n")
             for topic in paper['topics']:
@@ -69,12 +78,55 @@ def write_papers_to_file(papers):
                 rev_count = topic.get('revisions', 0)
                 links = topic.get('links', '')
                 f.write(f"{topic['name']}::{status}::{rev_count}::{links}\n")
+    os.replace(tmp_path, FILE_PATH)
+
+def apply_topic_action(topic, data):
+    action = data.get('action')
+    
+    if action == 'toggle_status':
+        topic['completed'] = not topic['completed']
+    elif action == 'increment_revision':
+        topic['revisions'] += 1
+    elif action == 'edit_full':
+        # Trimmed to match what read_papers_from_file() gives back after the line is stripped
+        revisions = int(data.get('revisions', topic['revisions']))
+        name = data.get('name', topic['name'])
+        links = data.get('links', topic['links'])
+        topic['name'] = name.strip() if isinstance(name, str) else topic['name']
+        topic['revisions'] = revisions
+        topic['links'] = links.strip() if isinstance(links, str) else topic['links']
 
 # --- API Routes ---
 
+def arg_flag(name):
+    return request.args.get(name) in ('1', 'true')
+
+def wants_stream():
+    if arg_flag('stream'):
+        return True
+    return 'application/x-ndjson' in request.headers.get('Accept', '')
+
+def summarize_paper(paper):
+    # Header-only view of a paper; topics are fetched separately when the block is expanded
+    return {
+        'code': paper['code'],
+        'topic_count': len(paper['topics']),
+        'completed_count': sum(1 for t in paper['topics'] if t['completed'])
+    }
+
 @app.route('/api/papers', methods=['GET'])
 def get_papers():
-    return jsonify(read_papers_from_file())
+    papers = iter_papers_from_file()
+    if arg_flag('summary'):
+        papers = (summarize_paper(p) for p in papers)
+
+    if wants_stream():
+        # NDJSON: one paper per line, flushed as soon as it is parsed
+        def generate():
+            for paper in papers:
+                yield json.dumps(paper) + "\n"
+        return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+    return jsonify(list(papers))
 
 @app.route('/api/papers', methods=['POST'])
 def add_paper():
@@ -82,10 +134,19 @@ def add_paper():
     code = data.get('code', '').strip()
     if not code: return jsonify({'error': 'Code required'}), 400
     
-    papers = read_papers_from_file()
-    papers.append({'code': code, 'topics': []})
-    write_papers_to_file(papers)
-    return jsonify({'code': code}), 201
+    with file_lock:
+        papers = read_papers_from_file()
+        papers.append({'code': code, 'topics': []})
+        write_papers_to_file(papers)
+        return jsonify({'code': code}), 201
+
+@app.route('/api/topics', methods=['GET'])
+def get_topics():
+    paper_code = request.args.get('paper_code', '').strip()
+    for paper in iter_papers_from_file():
+        if paper['code'] == paper_code:
+            return jsonify(paper['topics'])
+    return jsonify({'error': 'Paper not found'}), 404
 
 @app.route('/api/topics', methods=['POST'])
 def add_topic():
@@ -94,26 +155,27 @@ def add_topic():
     name = data.get('name', '').strip()
     links = data.get('links', '').strip()
     
-    papers = read_papers_from_file()
-    found = False
+    with file_lock:
+        papers = read_papers_from_file()
+        found = False
     
-    for paper in papers:
-        if paper['code'] == paper_code:
-            new_topic = {
-                'id': len(paper['topics']),
-                'name': name,
-                'completed': False,
-                'revisions': 0,
-                'links': links
-            }
-            paper['topics'].append(new_topic)
-            found = True
-            break
+        for paper in papers:
+            if paper['code'] == paper_code:
+                new_topic = {
+                    'id': len(paper['topics']),
+                    'name': name,
+                    'completed': False,
+                    'revisions': 0,
+                    'links': links
+                }
+                paper['topics'].append(new_topic)
+                found = True
+                break
             
-    if found:
-        write_papers_to_file(papers)
-        return jsonify({'success': True}), 201
-    return jsonify({'error': 'Paper not found'}), 404
+        if found:
+            write_papers_to_file(papers)
+            return jsonify({'success': True}), 201
+        return jsonify({'error': 'Paper not found'}), 404
 
 @app.route('/api/topics', methods=['PUT'])
 def update_topic():
@@ -121,26 +183,17 @@ def update_topic():
     paper_code = data.get('paper_code').strip()
     topic_id = int(data.get('topic_id'))
     
-    papers = read_papers_from_file()
-    for paper in papers:
-        if paper['code'] == paper_code:
-            if 0 <= topic_id < len(paper['topics']):
-                topic = paper['topics'][topic_id]
-                action = data.get('action')
-                
-                if action == 'toggle_status':
-                    topic['completed'] = not topic['completed']
-                elif action == 'increment_revision':
-                    topic['revisions'] += 1
-                elif action == 'edit_full':
-                    topic['name'] = data.get('name', topic['name'])
-                    topic['revisions'] = int(data.get('revisions', topic['revisions']))
-                    topic['links'] = data.get('links', topic['links'])
-                
-                write_papers_to_file(papers)
-                return jsonify(topic)
+    with file_lock:
+        papers = read_papers_from_file()
+        for paper in papers:
+            if paper['code'] == paper_code:
+                if 0 <= topic_id < len(paper['topics']):
+                    topic = paper['topics'][topic_id]
+                    apply_topic_action(topic, data)
+                    write_papers_to_file(papers)
+                    return jsonify(topic)
     
-    return jsonify({'error': 'Topic not found'}), 404
+        return jsonify({'error': 'Topic not found'}), 404
 
 @app.route('/api/topics', methods=['DELETE'])
 def delete_topic():
@@ -148,25 +201,163 @@ def delete_topic():
     paper_code = data.get('paper_code').strip()
     topic_id = int(data.get('topic_id'))
     
-    papers = read_papers_from_file()
-    for paper in papers:
-        if paper['code'] == paper_code:
-            if 0 <= topic_id < len(paper['topics']):
-                paper['topics'].pop(topic_id)
-                updated_topics = [{'id': i, **{k:v for k,v in t.items() if k != 'id'}} for i, t in enumerate(paper['topics'])]
-                paper['topics'] = updated_topics
-                write_papers_to_file(papers)
-                return jsonify({'success': True})
-    return jsonify({'error': 'Topic not found'}), 404
+    with file_lock:
+        papers = read_papers_from_file()
+        for paper in papers:
+            if paper['code'] == paper_code:
+                if 0 <= topic_id < len(paper['topics']):
+                    paper['topics'].pop(topic_id)
+                    updated_topics = [{'id': i, **{k:v for k,v in t.items() if k != 'id'}} for i, t in enumerate(paper['topics'])]
+                    paper['topics'] = updated_topics
+                    write_papers_to_file(papers)
+                    return jsonify({'success': True})
+        return jsonify({'error': 'Topic not found'}), 404
 
 @app.route('/api/papers', methods=['DELETE'])
 def delete_paper():
     data = request.json
     code = data.get('code').strip()
-    papers = read_papers_from_file()
-    papers = [p for p in papers if p['code'] != code]
-    write_papers_to_file(papers)
-    return jsonify({'success': True})
+    with file_lock:
+        papers = read_papers_from_file()
+        papers = [p for p in papers if p['code'] != code]
+        write_papers_to_file(papers)
+        return jsonify({'success': True})
+
+# --- Offline Sync ---
+
+# Ids of mutations already applied, so a batch retried after a lost response is not applied twice.
+# Kept next to the data file so they survive the server process being killed.
+SYNCED_IDS_PATH = os.path.join(storage_dir, 'pyq_synced_ids.txt')
+MAX_APPLIED_MUTATION_IDS = 5000
+applied_mutation_ids = None
+
+def load_applied_mutation_ids():
+    global applied_mutation_ids
+    if applied_mutation_ids is None:
+        applied_mutation_ids = OrderedDict()
+        if os.path.exists(SYNCED_IDS_PATH):
+            with open(SYNCED_IDS_PATH, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip(): applied_mutation_ids[line.strip()] = True
+    return applied_mutation_ids
+
+def save_applied_mutation_ids(mids):
+    ids = load_applied_mutation_ids()
+    for mid in mids:
+        ids[mid] = True
+    while len(ids) > MAX_APPLIED_MUTATION_IDS:
+        ids.popitem(last=False)
+    fd, tmp_path = tempfile.mkstemp(dir=storage_dir, suffix='.tmp')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        for mid in ids:
+            f.write(f"{mid}\n")
+    os.replace(tmp_path, SYNCED_IDS_PATH)
+
+TOPIC_FIELDS = ('name', 'completed', 'revisions', 'links')
+
+def mutation_text(mutation, key):
+    # JSON null or any non-string counts as empty, never as the text "None"
+    value = mutation.get(key)
+    return value.strip() if isinstance(value, str) else ''
+
+def find_paper(papers, code):
+    for paper in papers:
+        if paper['code'] == code:
+            return paper
+    return None
+
+def find_expected_topic(papers, mutation):
+    # Queued edits carry the topic as the client last saw it; any difference means it changed underneath them
+    paper = find_paper(papers, mutation_text(mutation, 'paper_code'))
+    if paper is None:
+        return None, None
+    topic_id = int(mutation.get('topic_id', -1))
+    if not 0 <= topic_id < len(paper['topics']):
+        return paper, None
+    topic = paper['topics'][topic_id]
+    expected = mutation.get('expected') or {}
+    if any(topic[k] != expected[k] for k in TOPIC_FIELDS if k in expected):
+        return paper, None
+    return paper, topic
+
+def apply_mutation(papers, mutation):
+    op = mutation.get('op')
+
+    if op == 'add_paper':
+        code = mutation_text(mutation, 'code')
+        if not code: return 'error'
+        if find_paper(papers, code) is not None: return 'conflict'
+        papers.append({'code': code, 'topics': []})
+        return 'applied'
+
+    if op == 'delete_paper':
+        code = mutation_text(mutation, 'code')
+        papers[:] = [p for p in papers if p['code'] != code]
+        return 'applied'
+
+    if op == 'add_topic':
+        paper = find_paper(papers, mutation_text(mutation, 'paper_code'))
+        name = mutation_text(mutation, 'name')
+        if not name: return 'error'
+        if paper is None: return 'conflict'
+        paper['topics'].append({
+            'id': len(paper['topics']),
+            'name': name,
+            'completed': False,
+            'revisions': 0,
+            'links': mutation_text(mutation, 'links')
+        })
+        return 'applied'
+
+    if op == 'update_topic':
+        paper, topic = find_expected_topic(papers, mutation)
+        if topic is None: return 'conflict'
+        apply_topic_action(topic, mutation)
+        return 'applied'
+
+    if op == 'delete_topic':
+        paper, topic = find_expected_topic(papers, mutation)
+        if topic is None: return 'conflict'
+        paper['topics'].pop(topic['id'])
+        paper['topics'] = [{'id': i, **{k:v for k,v in t.items() if k != 'id'}} for i, t in enumerate(paper['topics'])]
+        return 'applied'
+
+    return 'error'
+
+@app.route('/api/sync', methods=['POST'])
+def sync_mutations():
+    data = request.get_json(silent=True)
+    mutations = data.get('mutations') if isinstance(data, dict) else None
+    if not isinstance(mutations, list): return jsonify({'error': 'Mutations required'}), 400
+
+    # The lock also guards the shared id cache, so overlapping batches from several devices serialize
+    with file_lock:
+        papers = read_papers_from_file()
+        seen_ids = load_applied_mutation_ids()
+        results = []
+        applied_ids = []
+        for mutation in mutations:
+            # Bad entries are reported per mutation so one of them cannot wedge the client's queue
+            mid = mutation.get('mid') if isinstance(mutation, dict) else None
+            if not isinstance(mid, str) or not mid:
+                results.append({'mid': None, 'status': 'error'})
+                continue
+            if mid in seen_ids or mid in applied_ids:
+                results.append({'mid': mid, 'status': 'applied'})
+                continue
+            try:
+                status = apply_mutation(papers, mutation)
+            except (TypeError, ValueError, AttributeError, OverflowError):
+                status = 'error'
+            if status == 'applied':
+                applied_ids.append(mid)
+            results.append({'mid': mid, 'status': status})
+
+        # One write for the whole batch; the ids are recorded only once the data is on disk
+        if applied_ids:
+            write_papers_to_file(papers)
+            save_applied_mutation_ids(applied_ids)
+    return jsonify({'results': results})
 
 # ====================================================================================
 # 2. FRONTEND (HTML, CSS, JAVASCRIPT) - FANTASTIC UI
@@ -225,6 +416,14 @@ HTML_TEMPLATE = """
             animation: glowPulse 3s infinite alternate;
         }
 
+        .sync-status {
+            font-family: 'Orbitron', sans-serif;
+            font-size: 0.75rem;
+            letter-spacing: 2px;
+            color: rgba(255,255,255,0.4);
+            margin-top: 10px;
+        }
+
         /* --- Create Paper Section --- */
         .create-section {
             display: flex;
@@ -288,6 +487,7 @@ HTML_TEMPLATE = """
             animation: slideInUp 0.6s cubic-bezier(0.2, 0.8, 0.2, 1) forwards;
             opacity: 0;
         }
+        .paper-block.settled { animation: none; opacity: 1; }
         .paper-block:hover {
             border-color: rgba(255, 255, 255, 0.2);
             transform: translateY(-5px);
@@ -308,6 +508,10 @@ HTML_TEMPLATE = """
             font-size: 1.5rem;
             text-shadow: 0 0 10px rgba(6, 182, 212, 0.5);
         }
+        .paper-controls { display: flex; align-items: center; gap: 12px; }
+        .paper-progress { font-family: 'Orbitron', sans-serif; font-size: 0.8rem; color: rgba(255,255,255,0.5); letter-spacing: 1px; }
+        .btn-toggle { background: transparent; border: 1px solid var(--primary); color: var(--primary); padding: 5px 15px; cursor: pointer; font-family: 'Orbitron'; font-size: 0.8rem; transition: 0.3s; }
+        .btn-toggle:hover { background: var(--primary); color: #000; box-shadow: 0 0 15px var(--primary); }
 
         /* --- Add Topic Row --- */
         .add-row {
@@ -334,14 +538,16 @@ HTML_TEMPLATE = """
             box-shadow: 0 0 15px white;
         }
 
-        /* --- Horizontal Table --- */
+        /* --- Horizontal Table (rows are windowed, so height must match ROW_HEIGHT / TABLE_HEIGHT in JS) --- */
         .table-wrapper {
             width: 100%;
-            overflow-x: auto;
-            padding: 10px 0;
+            max-height: 480px;
+            overflow: auto;
+            padding: 0 0 10px;
         }
+        .paper-block:not(.expanded) .table-wrapper { display: none; }
         /* Custom Scrollbar */
-        .table-wrapper::-webkit-scrollbar { height: 6px; }
+        .table-wrapper::-webkit-scrollbar { width: 6px; height: 6px; }
         .table-wrapper::-webkit-scrollbar-track { background: #000; }
         .table-wrapper::-webkit-scrollbar-thumb { background: var(--primary); border-radius: 3px; }
 
@@ -352,6 +558,7 @@ HTML_TEMPLATE = """
         }
 
         .table-row { display: contents; }
+        .row-spacer { grid-column: 1 / -1; }
         
         .header-cell, .data-cell {
             padding: 18px 15px;
@@ -364,6 +571,7 @@ HTML_TEMPLATE = """
             text-overflow: ellipsis;
             transition: background 0.3s;
         }
+        .data-cell { height: 76px; }
         .data-cell:hover { background: rgba(255,255,255,0.02); }
 
         .header-cell {
@@ -373,6 +581,10 @@ HTML_TEMPLATE = """
             letter-spacing: 2px;
             justify-content: center;
             border-bottom: 2px solid rgba(255,255,255,0.05);
+            position: sticky;
+            top: 0;
+            background: #0b1222;
+            z-index: 6;
         }
         .header-cell:first-child { justify-content: flex-start; padding-left: 30px; }
         .header-cell:last-child { border-right: none; }
@@ -454,6 +666,12 @@ HTML_TEMPLATE = """
             100% { transform: translate(-50%, -50%) scale(6) rotate(0deg); opacity: 0; }
         }
 
+        /* Blur and hover lift are expensive on phone GPUs once many blocks are on screen */
+        @media (hover: none) {
+            .paper-block { backdrop-filter: none; background: rgba(15, 23, 42, 0.92); }
+            .paper-block:hover { transform: none; }
+        }
+
         /* --- Modal --- */
         .modal {
             display: none; position: fixed; top: 0; left: 0; width: 100%; height: 100%;
@@ -474,6 +692,7 @@ HTML_TEMPLATE = """
 
     <div class="main-header">
         <h1>PYQ Tracker</h1>
+        <div class="sync-status" id="sync-status"></div>
     </div>
 
     <!-- Create Paper -->
@@ -512,165 +731,539 @@ HTML_TEMPLATE = """
             setTimeout(() => el.remove(), 1500);
         };
 
-        const render = async () => {
-            const res = await fetch('/api/papers');
-            const papers = await res.json();
-            const list = document.getElementById('papers-list');
-            list.innerHTML = '';
+        let renderSeq = 0;
+
+        // Rows are windowed: every row is ROW_HEIGHT px tall, so only the slice in view is kept in the DOM
+        const ROW_HEIGHT = 76;
+        const TABLE_HEIGHT = 480;
+        const ROW_BUFFER = 6;
+        const HEADER_HTML = `
+            <div class="header-cell">MODULE</div>
+            <div class="header-cell">STATUS</div>
+            <div class="header-cell">CYCLES</div>
+            <div class="header-cell">DATA LINKS</div>
+            <div class="header-cell">OP</div>
+        `;
+
+        // --- Local Store (IndexedDB): 'papers' mirrors the server, 'queue' holds mutations not yet synced ---
+        const dbReady = new Promise((resolve, reject) => {
+            const req = indexedDB.open('pyq-tracker', 1);
+            req.onupgradeneeded = () => {
+                req.result.createObjectStore('papers', { keyPath: 'code' });
+                req.result.createObjectStore('queue', { keyPath: 'seq', autoIncrement: true });
+            };
+            req.onsuccess = () => resolve(req.result);
+            req.onerror = () => reject(req.error);
+        });
 
-            papers.forEach((paper, index) => {
-                const block = document.createElement('div');
-                block.className = 'paper-block';
-                block.style.animationDelay = `${index * 0.1}s`; // Staggered Animation
-                block.dataset.paperCode = paper.code;
-
-                let rowsHtml = '';
-                paper.topics.forEach((topic, tIndex) => {
-                    const doneClass = topic.completed ? 'row-done' : '';
-                    const statusClass = topic.completed ? 'status-completed' : 'status-pending';
-                    const statusText = topic.completed ? 'ACQUIRED' : 'PENDING';
-                    
-                    let linksHtml = '';
-                    if(topic.links) {
-                        topic.links.split(',').forEach(u => {
-                            if(u.trim()) linksHtml += `<a href="${u.trim().startsWith('http')?u.trim():'https://'+u.trim()}" target="_blank" class="link-pill">LINK</a>`;
-                        });
-                    }
-
-                    rowsHtml += `
-                        <div class="table-row ${doneClass}" data-paper="${paper.code}" data-id="${topic.id}">
-                            <div class="data-cell" style="position:relative">
-                                ${topic.name}
-                                <div class="red-line"></div>
-                            </div>
-                            <div class="data-cell" style="justify-content:center">
-                                <div class="status-badge ${statusClass}">${statusText}</div>
-                            </div>
-                            <div class="data-cell">
-                                <div class="rev-circle">#${topic.revisions}</div>
-                            </div>
-                            <div class="data-cell">${linksHtml || '<span style="color:#333">NO DATA</span>'}</div>
-                            <div class="data-cell action-cell">
-                                <button class="icon-btn" style="color:var(--primary)">✎</button>
-                                <button class="icon-btn" style="color:var(--secondary)">✕</button>
-                            </div>
-                        </div>
-                    `;
+        const idb = async (storeName, mode, fn) => {
+            const db = await dbReady;
+            return new Promise((resolve, reject) => {
+                const tx = db.transaction(storeName, mode);
+                const req = fn(tx.objectStore(storeName));
+                tx.oncomplete = () => resolve(req && req.result);
+                tx.onerror = () => reject(tx.error);
+            });
+        };
+
+        // Without IndexedDB (private modes, some WebViews) nothing is cached and the queue lives in memory
+        let useDb = true;
+        let memoryQueue = [];
+        let memorySeq = 0;
+
+        const idbAll = (storeName) => {
+            if (useDb) return idb(storeName, 'readonly', store => store.getAll());
+            return Promise.resolve(storeName === 'queue' ? memoryQueue.slice() : []);
+        };
+        const idbPut = (storeName, value) => {
+            if (useDb) return idb(storeName, 'readwrite', store => store.put(value));
+            if (storeName === 'queue') memoryQueue.push({ ...value, seq: ++memorySeq });
+            return Promise.resolve();
+        };
+        const idbDelete = (storeName, keys) => {
+            if (useDb) return idb(storeName, 'readwrite', store => { [].concat(keys).forEach(k => store.delete(k)); });
+            if (storeName === 'queue') {
+                const dropped = new Set([].concat(keys));
+                memoryQueue = memoryQueue.filter(m => !dropped.has(m.seq));
+            }
+            return Promise.resolve();
+        };
+
+        // Per-paper client state, keyed by paper code
+        const paperState = new Map();
+        const getState = (code) => {
+            if (!paperState.has(code)) {
+                paperState.set(code, {
+                    code, position: 0, topic_count: 0, completed_count: 0, topics: null, fresh: false,
+                    block: null, expanded: false, visible: true, loading: null, first: -1, last: -1, frame: 0
                 });
+            }
+            return paperState.get(code);
+        };
+        const orderedStates = () => [...paperState.values()].sort((a, b) => a.position - b.position);
+
+        const persist = (state) => idbPut('papers', {
+            code: state.code,
+            position: state.position,
+            topic_count: state.topic_count,
+            completed_count: state.completed_count,
+            topics: state.topics
+        });
+
+        // --- Sync Status ---
+        let pendingCount = 0;
+        let syncNote = '';
+        const updateSyncStatus = () => {
+            const parts = [navigator.onLine ? 'ONLINE' : 'OFFLINE'];
+            if (pendingCount) parts.push(`${pendingCount} PENDING`);
+            if (syncNote) parts.push(syncNote);
+            document.getElementById('sync-status').innerText = parts.join(' · ');
+        };
+
+        // Expanded blocks only hold rendered rows while they are near the viewport
+        const blockObserver = window.IntersectionObserver ? new IntersectionObserver((entries) => {
+            entries.forEach(entry => {
+                const state = getState(entry.target.dataset.paperCode);
+                if (state.block !== entry.target) return;
+                state.visible = entry.isIntersecting;
+                if (!state.expanded) return;
+                if (state.visible) showTopics(state); else clearRows(state);
+            });
+        }, { rootMargin: '300px 0px' }) : null;
+
+        const buildTopicRow = (code, topic) => {
+            const doneClass = topic.completed ? 'row-done' : '';
+            const statusClass = topic.completed ? 'status-completed' : 'status-pending';
+            const statusText = topic.completed ? 'ACQUIRED' : 'PENDING';
 
-                block.innerHTML = `
-                    <div class="paper-header">
-                        <span class="paper-title">[CODE: ${paper.code}]</span>
-                        <button class="btn-del-paper" onclick="deletePaper('${paper.code}')">TERMINATE</button>
+            let linksHtml = '';
+            if(topic.links) {
+                topic.links.split(',').forEach(u => {
+                    if(u.trim()) linksHtml += `<a href="${u.trim().startsWith('http')?u.trim():'https://'+u.trim()}" target="_blank" class="link-pill">LINK</a>`;
+                });
+            }
+
+            return `
+                <div class="table-row ${doneClass}" data-paper="${code}" data-id="${topic.id}">
+                    <div class="data-cell" style="position:relative">
+                        ${topic.name}
+                        <div class="red-line"></div>
+                    </div>
+                    <div class="data-cell" style="justify-content:center">
+                        <div class="status-badge ${statusClass}">${statusText}</div>
+                    </div>
+                    <div class="data-cell">
+                        <div class="rev-circle">#${topic.revisions}</div>
                     </div>
-                    <div class="add-row">
-                        <input type="text" class="topic-input" placeholder="Topic Identifier">
-                        <input type="text" class="link-input" placeholder="Reference Links">
-                        <button class="btn-add" onclick="handleAddTopic(event)">+</button>
+                    <div class="data-cell">${linksHtml || '<span style="color:#333">NO DATA</span>'}</div>
+                    <div class="data-cell action-cell">
+                        <button class="icon-btn" style="color:var(--primary)">✎</button>
+                        <button class="icon-btn" style="color:var(--secondary)">✕</button>
                     </div>
-                    <div class="table-wrapper">
-                        <div class="topic-table">
-                            <div class="header-cell">MODULE</div>
-                            <div class="header-cell">STATUS</div>
-                            <div class="header-cell">CYCLES</div>
-                            <div class="header-cell">DATA LINKS</div>
-                            <div class="header-cell">OP</div>
-                            ${rowsHtml}
-                        </div>
+                </div>
+            `;
+        };
+
+        const buildPaperBlock = (state, index, animate) => {
+            const block = document.createElement('div');
+            block.className = 'paper-block' + (state.expanded ? ' expanded' : '') + (animate ? '' : ' settled');
+            block.style.animationDelay = `${Math.min(index, 10) * 0.1}s`; // Staggered Animation (capped for long streams)
+            block.dataset.paperCode = state.code;
+            Object.assign(state, { block, visible: !blockObserver, first: -1, last: -1 });
+
+            block.innerHTML = `
+                <div class="paper-header">
+                    <span class="paper-title">[CODE: ${state.code}]</span>
+                    <div class="paper-controls">
+                        <span class="paper-progress">${state.completed_count}/${state.topic_count}</span>
+                        <button class="btn-toggle" onclick="togglePaper(event)">${state.expanded ? 'COLLAPSE' : 'EXPAND'}</button>
+                        <button class="btn-del-paper" onclick="deletePaper('${state.code}')">TERMINATE</button>
                     </div>
-                `;
-                list.appendChild(block);
+                </div>
+                <div class="add-row">
+                    <input type="text" class="topic-input" placeholder="Topic Identifier">
+                    <input type="text" class="link-input" placeholder="Reference Links">
+                    <button class="btn-add" onclick="handleAddTopic(event)">+</button>
+                </div>
+                <div class="table-wrapper">
+                    <div class="topic-table">${HEADER_HTML}</div>
+                </div>
+            `;
+            block.querySelector('.table-wrapper').addEventListener('scroll', () => scheduleWindow(state), { passive: true });
+
+            if (blockObserver) blockObserver.observe(block);
+            else if (state.expanded) showTopics(state);
+            return block;
+        };
+
+        const drawList = (animate) => {
+            const list = document.getElementById('papers-list');
+            if (blockObserver) blockObserver.disconnect();
+            list.innerHTML = '';
+            orderedStates().forEach((state, index) => list.appendChild(buildPaperBlock(state, index, animate)));
+        };
+
+        const updateProgress = (state) => {
+            if (state.topics) {
+                state.topic_count = state.topics.length;
+                state.completed_count = state.topics.filter(t => t.completed).length;
+            }
+            if (state.block) state.block.querySelector('.paper-progress').innerText = `${state.completed_count}/${state.topic_count}`;
+        };
+
+        const fetchTopics = async (state) => {
+            const epoch = mutationEpoch;
+            const res = await fetch(`/api/topics?paper_code=${encodeURIComponent(state.code)}`);
+            if (!res.ok) return;
+            const topics = await res.json();
+            // Edits made or still queued since the request went out are not in this list; reload once they sync
+            if (pendingCount > 0 || epoch !== mutationEpoch) {
+                needsRefresh = true;
+                scheduleFlush();
+                return;
+            }
+            state.topics = topics;
+            state.fresh = true;
+            state.first = state.last = -1;
+            updateProgress(state);
+            persist(state);
+        };
+
+        // Cached topics render at once; while online with nothing queued they are revalidated once per refresh
+        const ensureTopics = (state) => {
+            const stale = !state.fresh && pendingCount === 0 && navigator.onLine;
+            if (state.topics && !stale) return Promise.resolve();
+            if (!state.loading) state.loading = fetchTopics(state).catch(() => {}).finally(() => { state.loading = null; });
+            return state.loading;
+        };
+
+        const renderWindow = (state) => {
+            const wrapper = state.block.querySelector('.table-wrapper');
+            const total = state.topics.length;
+            const first = Math.max(0, Math.floor(wrapper.scrollTop / ROW_HEIGHT) - ROW_BUFFER);
+            const last = Math.min(total, first + Math.ceil(TABLE_HEIGHT / ROW_HEIGHT) + ROW_BUFFER * 2);
+            if (first === state.first && last === state.last) return;
+            state.first = first;
+            state.last = last;
+
+            const rowsHtml = state.topics.slice(first, last).map(t => buildTopicRow(state.code, t)).join('');
+            state.block.querySelector('.topic-table').innerHTML = HEADER_HTML
+                + `<div class="row-spacer" style="height:${first * ROW_HEIGHT}px"></div>`
+                + rowsHtml
+                + `<div class="row-spacer" style="height:${(total - last) * ROW_HEIGHT}px"></div>`;
+        };
+
+        // Drops rendered rows but keeps the scroll height so the position survives re-entry
+        const clearRows = (state) => {
+            if (!state.topics || state.first < 0) return;
+            state.first = state.last = -1;
+            state.block.querySelector('.topic-table').innerHTML = HEADER_HTML
+                + `<div class="row-spacer" style="height:${state.topics.length * ROW_HEIGHT}px"></div>`;
+        };
+
+        const scheduleWindow = (state) => {
+            if (state.frame) return;
+            state.frame = requestAnimationFrame(() => {
+                state.frame = 0;
+                if (state.topics && state.expanded && state.visible) renderWindow(state);
             });
         };
 
-        const addPaper = async () => {
+        const showTopics = async (state) => {
+            const block = state.block;
+            if (state.topics) renderWindow(state);
+            await ensureTopics(state);
+            if (state.block === block && state.expanded && state.visible && state.topics) renderWindow(state);
+        };
+
+        window.togglePaper = (e) => {
+            const block = e.target.closest('.paper-block');
+            const state = getState(block.dataset.paperCode);
+            state.expanded = !state.expanded;
+            block.classList.toggle('expanded', state.expanded);
+            e.target.innerText = state.expanded ? 'COLLAPSE' : 'EXPAND';
+            if (state.expanded && state.visible) showTopics(state);
+            else clearRows(state);
+        };
+
+        // Forgets cached topics and takes their rows off screen, so no click can reach a missing topic
+        const dropTopics = (state) => {
+            Object.assign(state, { topics: null, fresh: false, first: -1, last: -1 });
+            if (state.block) state.block.querySelector('.topic-table').innerHTML = HEADER_HTML;
+        };
+
+        // Brings the list in line with the server, touching only the blocks that changed
+        const reconcile = (summaries) => {
+            const list = document.getElementById('papers-list');
+            const seen = new Set(summaries.map(summary => summary.code));
+            const kept = orderedStates().map(state => state.code).filter(code => seen.has(code));
+            // Existing papers still lead in the same order, so new ones can simply be appended
+            const inOrder = kept.every((code, i) => summaries[i].code === code);
+
+            orderedStates().filter(state => !seen.has(state.code)).forEach(state => {
+                if (state.block) {
+                    if (blockObserver) blockObserver.unobserve(state.block);
+                    state.block.remove();
+                }
+                paperState.delete(state.code);
+                idbDelete('papers', state.code);
+            });
+
+            summaries.forEach((summary, index) => {
+                const isNew = !paperState.has(summary.code);
+                const state = getState(summary.code);
+                // Cached topics survive only while the counts still agree; expanded blocks revalidate them anyway
+                if (state.topic_count !== summary.topic_count || state.completed_count !== summary.completed_count) dropTopics(state);
+                Object.assign(state, summary, { position: index, fresh: false });
+                persist(state);
+                if (!inOrder) return;
+                if (isNew) {
+                    list.appendChild(buildPaperBlock(state, index, false));
+                } else {
+                    updateProgress(state);
+                    if (state.expanded && state.visible) showTopics(state);
+                }
+            });
+
+            if (!inOrder) drawList(false);
+        };
+
+        // Pulls paper summaries from the server; blocks stream in progressively when nothing was cached.
+        // Network and parse failures throw, leaving needsRefresh set so flushQueue retries with backoff.
+        const refreshFromServer = async () => {
+            const seq = ++renderSeq;
+            const epoch = mutationEpoch;
+            const res = await fetch('/api/papers?stream=1&summary=1', { headers: { 'Accept': 'application/x-ndjson' } });
+            if (seq !== renderSeq) return;
+            if (!res.ok) throw new Error(`Refresh failed: ${res.status}`);
+            const list = document.getElementById('papers-list');
+            const progressive = paperState.size === 0;
+            const summaries = [];
+
+            const appendLine = (line) => {
+                if (!line.trim()) return;
+                const summary = JSON.parse(line);
+                const index = summaries.push(summary) - 1;
+                // With nothing cached there is no local state to protect, so blocks go straight in
+                if (progressive && !paperState.has(summary.code)) {
+                    const state = getState(summary.code);
+                    Object.assign(state, summary, { position: index });
+                    persist(state);
+                    list.appendChild(buildPaperBlock(state, index, true));
+                }
+            };
+
+            if (!res.body || !window.TextDecoder) {
+                const text = await res.text();
+                if (seq !== renderSeq) return;
+                text.split('\\n').forEach(appendLine);
+            } else {
+                const reader = res.body.getReader();
+                const decoder = new TextDecoder();
+                let buffer = '';
+                while (true) {
+                    const { done, value } = await reader.read();
+                    if (seq !== renderSeq) { reader.cancel(); return; } // A newer refresh took over
+                    if (done) break;
+                    buffer += decoder.decode(value, { stream: true });
+                    const lines = buffer.split('\\n');
+                    buffer = lines.pop();
+                    lines.forEach(appendLine);
+                }
+                appendLine(buffer + decoder.decode());
+            }
+
+            // Edits made while the stream was open are not in it; keep local state and retry after they sync
+            if (pendingCount > 0 || epoch !== mutationEpoch) {
+                needsRefresh = true;
+                scheduleFlush();
+                return;
+            }
+            reconcile(summaries);
+            needsRefresh = false;
+        };
+
+        // --- Mutation Queue: changes apply locally at once and replay to /api/sync in batches ---
+        let flushTimer = 0;
+        let flushing = false;
+        let needsRefresh = false;
+        let retryDelay = 1000;
+        let mutationEpoch = 0;
+
+        const scheduleFlush = (delay = 800) => {
+            clearTimeout(flushTimer);
+            flushTimer = setTimeout(flushQueue, delay);
+        };
+
+        const mutate = (mutation, applyLocal) => {
+            applyLocal();
+            mutationEpoch++;
+            mutation.mid = `${Date.now().toString(36)}-${Math.random().toString(36).slice(2, 10)}`;
+            pendingCount++;
+            updateSyncStatus();
+            idbPut('queue', mutation).then(() => scheduleFlush());
+        };
+
+        // Server rejected these; drop the affected cached topics and reload them from the server
+        const markConflicts = (queued, rejected) => {
+            const byMid = new Map(queued.map(m => [m.mid, m]));
+            rejected.forEach(r => {
+                const m = byMid.get(r.mid);
+                const state = m && paperState.get(m.paper_code || m.code);
+                if (state) dropTopics(state);
+            });
+            syncNote = `${rejected.length} CONFLICT${rejected.length > 1 ? 'S' : ''} · RELOADED`;
+            needsRefresh = true;
+        };
+
+        const flushQueue = async () => {
+            if (flushing) return;
+            flushing = true;
+            let ok = true;
+            try {
+                const queued = await idbAll('queue');
+                if (queued.length) {
+                    const res = await fetch('/api/sync', {
+                        method: 'POST',
+                        headers: {'Content-Type': 'application/json'},
+                        body: JSON.stringify({ mutations: queued })
+                    });
+                    if (!res.ok) throw new Error(`Sync failed: ${res.status}`);
+                    const { results } = await res.json();
+                    await idbDelete('queue', queued.map(m => m.seq));
+                    pendingCount = Math.max(0, pendingCount - queued.length);
+                    retryDelay = 1000;
+                    const rejected = results.filter(r => r.status !== 'applied');
+                    if (rejected.length) markConflicts(queued, rejected);
+                }
+            } catch (err) {
+                ok = false;
+                scheduleFlush(retryDelay);
+                retryDelay = Math.min(retryDelay * 2, 30000);
+            }
+            flushing = false;
+            updateSyncStatus();
+
+            if (ok && pendingCount > 0) scheduleFlush();
+            else if (ok && needsRefresh) {
+                try {
+                    await refreshFromServer();
+                    retryDelay = 1000;
+                } catch (err) {
+                    // Offline, a cut-off stream or a bad line: the cached view stays and the refresh is retried
+                    scheduleFlush(retryDelay);
+                    retryDelay = Math.min(retryDelay * 2, 30000);
+                }
+            }
+        };
+
+        // Replays anything queued, then pulls the server's view once the queue is empty
+        const syncNow = () => {
+            needsRefresh = true;
+            return flushQueue();
+        };
+
+        const snapshot = (topic) => ({ name: topic.name, completed: topic.completed, revisions: topic.revisions, links: topic.links });
+
+        const commitPaper = (state) => {
+            updateProgress(state);
+            persist(state);
+            state.first = state.last = -1;
+            if (state.topics && state.expanded && state.visible) renderWindow(state);
+        };
+
+        const updateTopic = (code, topicId, action, fields = {}) => {
+            const state = paperState.get(code);
+            const topic = state && state.topics && state.topics[topicId];
+            if (!topic) return; // Topics were dropped for a reload; the row is already gone
+            mutate({ op: 'update_topic', paper_code: code, topic_id: topicId, action, ...fields, expected: snapshot(topic) }, () => {
+                if (action === 'toggle_status') topic.completed = !topic.completed;
+                else if (action === 'increment_revision') topic.revisions += 1;
+                else if (action === 'edit_full') Object.assign(topic, fields);
+                commitPaper(state);
+            });
+        };
+
+        const addPaper = () => {
             const codeInput = document.getElementById('new-paper-code');
             const code = codeInput.value.trim();
             if(!code) return;
-            await fetch('/api/papers', {
-                method: 'POST',
-                headers: {'Content-Type': 'application/json'},
-                body: JSON.stringify({ code })
+            if(paperState.has(code)) return alert('Paper already exists');
+            mutate({ op: 'add_paper', code }, () => {
+                const states = orderedStates();
+                const state = getState(code);
+                Object.assign(state, { position: states.length ? states[states.length - 1].position + 1 : 0, topics: [], fresh: true });
+                persist(state);
+                document.getElementById('papers-list').appendChild(buildPaperBlock(state, 0, true));
             });
             codeInput.value = '';
-            render();
         };
 
-        window.deletePaper = async (code) => {
+        window.deletePaper = (code) => {
             if(confirm('Terminate Paper Protocol?')) {
-                await fetch('/api/papers', {
-                    method: 'DELETE',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({ code })
+                mutate({ op: 'delete_paper', code }, () => {
+                    const state = getState(code);
+                    if (blockObserver) blockObserver.unobserve(state.block);
+                    state.block.remove();
+                    paperState.delete(code);
+                    idbDelete('papers', code);
                 });
-                render();
             }
         };
 
-        window.handleAddTopic = async (e) => {
+        window.handleAddTopic = (e) => {
             const block = e.target.closest('.paper-block');
             const paperCode = block.dataset.paperCode;
             const name = block.querySelector('.topic-input').value.trim();
             const links = block.querySelector('.link-input').value.trim();
             if(!name) return;
-            
-            await fetch('/api/topics', {
-                method: 'POST',
-                headers: {'Content-Type': 'application/json'},
-                body: JSON.stringify({ paper_code: paperCode, name, links })
+
+            const state = getState(paperCode);
+            mutate({ op: 'add_topic', paper_code: paperCode, name, links }, () => {
+                if (state.topics) state.topics.push({ id: state.topics.length, name, completed: false, revisions: 0, links });
+                else state.topic_count += 1;
+                commitPaper(state);
             });
-            render();
+            block.querySelector('.topic-input').value = '';
+            block.querySelector('.link-input').value = '';
         };
 
-        document.addEventListener('click', async (e) => {
+        document.addEventListener('click', (e) => {
             const row = e.target.closest('.table-row');
             if (!row) return;
-            
+
             const paperCode = row.dataset.paper;
             const topicId = parseInt(row.dataset.id);
+            const state = paperState.get(paperCode);
+            if (!state || !state.topics || !state.topics[topicId]) return;
 
             if (e.target.closest('.status-badge')) {
                 const isCompleting = !row.classList.contains('row-done');
                 if (isCompleting) triggerThumbsUp();
-
-                await fetch('/api/topics', {
-                    method: 'PUT',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({ paper_code: paperCode, topic_id: topicId, action: 'toggle_status' })
-                });
-                render();
+                updateTopic(paperCode, topicId, 'toggle_status');
             }
 
             if (e.target.closest('.rev-circle')) {
-                await fetch('/api/topics', {
-                    method: 'PUT',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({ paper_code: paperCode, topic_id: topicId, action: 'increment_revision' })
-                });
-                render();
+                updateTopic(paperCode, topicId, 'increment_revision');
             }
 
             if (e.target.closest('.icon-btn:last-child')) {
-                if(confirm('Delete Module?')) {
-                    await fetch('/api/topics', {
-                        method: 'DELETE',
-                        headers: {'Content-Type': 'application/json'},
-                        body: JSON.stringify({ paper_code: paperCode, topic_id: topicId })
+                if(confirm('Delete Module?') && state.topics) {
+                    mutate({ op: 'delete_topic', paper_code: paperCode, topic_id: topicId, expected: snapshot(state.topics[topicId]) }, () => {
+                        state.topics.splice(topicId, 1);
+                        state.topics.forEach((t, i) => { t.id = i; });
+                        commitPaper(state);
                     });
-                    render();
                 }
             }
 
             if (e.target.closest('.icon-btn:first-child')) {
-                const res = await fetch('/api/papers');
-                const papers = await res.json();
-                const paper = papers.find(p => p.code === paperCode);
-                const topic = paper.topics.find(t => t.id === topicId);
+                const topic = state.topics[topicId];
 
                 document.getElementById('edit-name').value = topic.name;
                 document.getElementById('edit-rev').value = topic.revisions;
                 document.getElementById('edit-links').value = topic.links;
-                
+
                 currentEditData = { paper: paperCode, id: topicId };
                 document.getElementById('edit-modal').style.display = 'flex';
             }
@@ -678,27 +1271,87 @@ HTML_TEMPLATE = """
 
         window.closeModal = () => document.getElementById('edit-modal').style.display = 'none';
 
-        window.saveEdit = async () => {
+        window.saveEdit = () => {
             const { paper, id } = currentEditData;
-            const name = document.getElementById('edit-name').value;
-            const rev = document.getElementById('edit-rev').value;
-            const links = document.getElementById('edit-links').value;
-
-            await fetch('/api/topics', {
-                method: 'PUT',
-                headers: {'Content-Type': 'application/json'},
-                body: JSON.stringify({ paper_code: paper, topic_id: id, action: 'edit_full', name, revisions: rev, links })
-            });
+            const name = document.getElementById('edit-name').value.trim();
+            const revisions = parseInt(document.getElementById('edit-rev').value) || 0;
+            const links = document.getElementById('edit-links').value.trim();
+
+            updateTopic(paper, id, 'edit_full', { name, revisions, links });
             closeModal();
-            render();
         };
 
-        render();
+        // Draw straight from the local cache, then sync with the server in the background
+        const start = async () => {
+            try {
+                pendingCount = (await idbAll('queue')).length;
+                const records = await idbAll('papers');
+                records.forEach(record => Object.assign(getState(record.code), record));
+            } catch (err) {
+                useDb = false; // IndexedDB unavailable: render from the server and send edits straight through
+            }
+            drawList(true);
+            updateSyncStatus();
+            syncNow();
+        };
+
+        window.addEventListener('online', syncNow);
+        window.addEventListener('offline', updateSyncStatus);
+        document.addEventListener('visibilitychange', () => {
+            if (document.visibilityState === 'visible') syncNow();
+        });
+
+        // Service workers only register on localhost or HTTPS; elsewhere the IndexedDB cache still applies
+        if ('serviceWorker' in navigator) navigator.serviceWorker.register('/sw.js').catch(() => {});
+
+        start();
     </script>
 </body>
 </html>
 """
 
+# Service worker: serves the app shell cache-first so reloads never wait on the server.
+# The cache name embeds a hash of HTML_TEMPLATE, so any change to the page installs a fresh shell.
+SW_TEMPLATE = """
+const SHELL_CACHE = 'pyq-shell-{{ shell_version }}';
+const ASSET_CACHE = 'pyq-assets';
+
+self.addEventListener('install', (e) => {
+    e.waitUntil(caches.open(SHELL_CACHE).then(cache => cache.add('/')).then(() => self.skipWaiting()));
+});
+
+self.addEventListener('activate', (e) => {
+    e.waitUntil(
+        caches.keys()
+            .then(keys => Promise.all(keys.filter(k => k !== SHELL_CACHE && k !== ASSET_CACHE).map(k => caches.delete(k))))
+            .then(() => self.clients.claim())
+    );
+});
+
+self.addEventListener('fetch', (e) => {
+    const req = e.request;
+    if (req.method !== 'GET') return;
+    const url = new URL(req.url);
+
+    // API calls always go to the network; the page keeps its own data in IndexedDB
+    if (url.origin === location.origin) {
+        if (req.mode === 'navigate' && url.pathname === '/') {
+            e.respondWith(caches.match('/').then(hit => hit || fetch(req)));
+        }
+        return;
+    }
+
+    if (url.hostname === 'fonts.googleapis.com' || url.hostname === 'fonts.gstatic.com') {
+        e.respondWith(caches.open(ASSET_CACHE).then(cache => cache.match(req).then(hit => hit || fetch(req).then(res => {
+            cache.put(req, res.clone());
+            return res;
+        }))));
+    }
+});
+"""
+
+SHELL_VERSION = hashlib.sha1(HTML_TEMPLATE.encode('utf-8')).hexdigest()[:12]
+
 # ====================================================================================
 # 3. MAIN FLASK ROUTE AND RUNNER
 # ====================================================================================
@@ -706,5 +1359,10 @@ HTML_TEMPLATE = """
 def index():
     return render_template_string(HTML_TEMPLATE)
 
+@app.route('/sw.js')
+def service_worker():
+    js = render_template_string(SW_TEMPLATE, shell_version=SHELL_VERSION)
+    return Response(js, mimetype='application/javascript', headers={'Cache-Control': 'no-cache'})
+
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0')